@@ -1,7 +1,14 @@
+import asyncio
+import logging
+import math
 import time
-from typing import Any, ClassVar, Mapping, Sequence, Tuple
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Final, List, Mapping, Sequence, Tuple
 
 import smbus2
+from google.protobuf.struct_pb2 import Value
+from smbus2 import i2c_msg
 from typing_extensions import Self
 from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
@@ -11,22 +18,113 @@ from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
 from viam.utils import SensorReading, ValueTypes, struct_to_dict
 
+# DHT-20 Constants
+DHT20_I2C_ADDRESS: Final = 0x38
+DHT20_CMD_INIT: Final = 0x71
+DHT20_CMD_MEASURE: Final = 0xAC
+DHT20_MEASURE_PARAMS: Final = (0x33, 0x00)
+DHT20_MEASURE_DELAY: Final = 0.1  # 100ms measurement delay
+DHT20_MIN_SAMPLE_INTERVAL: Final = 2.0  # Sensor refreshes its sample every ~2s
+DHT20_POWER_ON_DELAY: Final = 0.1  # 100ms stabilization after power-up
+DHT20_READ_TIMEOUT: Final = 1.0  # Default get_readings deadline
+DHT20_RETRY_DELAY: Final = 0.05  # Backoff before retrying a failed measurement
+DHT20_CLOSE_TIMEOUT: Final = 1.0  # Longest close() waits on the I2C worker
+DHT20_STALE_READING_LIMIT: Final = 10.0  # Floor on max cached age served on timeout
+
+# Expected reading ranges
+DHT20_TEMP_MIN: Final = -40.0
+DHT20_TEMP_MAX: Final = 80.0
+DHT20_HUM_MIN: Final = 0.0
+DHT20_HUM_MAX: Final = 100.0
+
+# Measurement trigger as sent on the wire
+_MEASURE_COMMAND: Final = bytes((DHT20_CMD_MEASURE, *DHT20_MEASURE_PARAMS))
+
+# Raw readings are 20-bit fractions of full scale
+_POW20: Final = 1 << 20
+_INV_POW20: Final = 1.0 / _POW20
+_TEMP_SCALE: Final = 200.0 * _INV_POW20
+_HUM_SCALE: Final = 100.0 * _INV_POW20
+
+# Model identifier, built once at import
+_MODEL: Final = Model(ModelFamily("ianwhalen", "dht-20"), "dht-20")
+
+# Shared result for get_geometries; never mutated
+_EMPTY_GEOMETRIES: Final[list[Geometry]] = []
+
+
+def _validate_i2c_bus(value: Value):
+    """Validate the i2c_bus attribute."""
+    if not value.HasField("number_value"):
+        raise Exception("i2c_bus must be a number value.")
+
+    i2c_bus_value = value.number_value
+    if not (i2c_bus_value == int(i2c_bus_value)):
+        raise Exception("i2c_bus must be an integer.")
+
+    if i2c_bus_value < 0:
+        raise Exception("i2c_bus must be a non-negative integer.")
+
+
+def _validate_poll_interval_s(value: Value):
+    """Validate the poll_interval_s attribute."""
+    if not value.HasField("number_value"):
+        raise Exception("poll_interval_s must be a number value.")
+
+    if value.number_value <= 0:
+        raise Exception("poll_interval_s must be positive.")
+
+
+async def _cancel_and_wait(task: asyncio.Task):
+    """Cancel a task and wait for it to unwind without raising its outcome."""
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        # Mark a failure as retrieved; the caller only needs the task stopped
+        task.exception()
+
 
 class Dht20(Sensor, EasyResource):
     """DHT-20 Temperature and Humidity Sensor Component"""
 
-    # DHT-20 Constants
-    DHT20_I2C_ADDRESS = 0x38
-    DHT20_CMD_INIT = 0x71
-    DHT20_CMD_MEASURE = 0xAC
-    DHT20_MEASURE_PARAMS = [0x33, 0x00]
-    DHT20_MEASURE_DELAY = 0.1  # 100ms measurement delay
-    MODEL: ClassVar[Model] = Model(ModelFamily("ianwhalen", "dht-20"), "dht-20")
+    MODEL: ClassVar[Model] = _MODEL
+    # Buses whose sensor has already had its power-on stabilization time
+    _powered_on_buses: ClassVar[set[int]] = set()
+    # Validators for the config attributes this model understands
+    _VALIDATORS: ClassVar[dict[str, Callable[[Value], None]]] = {
+        "i2c_bus": _validate_i2c_bus,
+        "poll_interval_s": _validate_poll_interval_s,
+    }
+    # do_command name -> handler method name
+    _HANDLERS: ClassVar[dict[str, str]] = {
+        "get_status": "_cmd_get_status",
+        "get_raw_data": "_cmd_get_raw_data",
+    }
 
     def __init__(self, name: str):
         super().__init__(name)
         self.i2c_bus: smbus2.SMBus | None = None
         self.i2c_bus_number: int = 1  # Default I2C bus
+        # Bus a scheduled _switch_bus will install, until it does
+        self._pending_bus: smbus2.SMBus | None = None
+        self._pending_bus_number: int | None = None
+        self.poll_interval_s: float = DHT20_MIN_SAMPLE_INTERVAL
+        self._poller_task: asyncio.Task | None = None
+        self._presence_task: asyncio.Task | None = None
+        # Single worker keeps I2C transactions serialized on the bus
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dht20-i2c"
+        )
+        # Most recent successful reading, reused within the sample interval
+        self._last_reading_monotonic: float = -math.inf
+        self._cached_readings: Mapping[str, SensorReading] | None = None
+        self._read_lock = asyncio.Lock()
+        # Measurement currently in flight, shared by concurrent callers
+        self._inflight: asyncio.Task | None = None
+        # Most recent raw frame, shared by readings and get_raw_data
+        self._last_frame: bytes | None = None
+        self._last_frame_monotonic: float = -math.inf
+        self._frame_lock = asyncio.Lock()
 
     @classmethod
     def new(
@@ -52,6 +150,7 @@ class Dht20(Sensor, EasyResource):
 
         Expected config attributes:
         - i2c_bus (optional): I2C bus number (default: 1)
+        - poll_interval_s (optional): Seconds between background readings (default: 2.0)
 
         Args:
             config (ComponentConfig): The configuration for this resource
@@ -61,18 +160,11 @@ class Dht20(Sensor, EasyResource):
                 first element is a list of required dependencies and the
                 second element is a list of optional dependencies
         """
-        # Validate I2C bus configuration if provided
-        if "i2c_bus" in config.attributes.fields:
-            i2c_bus_field = config.attributes.fields["i2c_bus"]
-            if not i2c_bus_field.HasField("number_value"):
-                raise Exception("i2c_bus must be a number value.")
-
-            i2c_bus_value = i2c_bus_field.number_value
-            if not (i2c_bus_value == int(i2c_bus_value)):
-                raise Exception("i2c_bus must be an integer.")
-
-            if i2c_bus_value < 0:
-                raise Exception("i2c_bus must be a non-negative integer.")
+        # Validate each known attribute that is provided
+        for name, value in config.attributes.fields.items():
+            validator = cls._VALIDATORS.get(name)
+            if validator is not None:
+                validator(value)
 
         return [], []
 
@@ -85,48 +177,122 @@ class Dht20(Sensor, EasyResource):
             config (ComponentConfig): The new configuration
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both required and optional)
         """
-        # Close existing I2C connection if any
-        if self.i2c_bus is not None:
+        # Get settings from configuration
+        attrs = struct_to_dict(config.attributes)
+        new_bus_number = int(attrs.get("i2c_bus", 1))
+        poll_interval_s = float(attrs.get("poll_interval_s", DHT20_MIN_SAMPLE_INTERVAL))
+
+        # Bus that will be in use once any pending switch has completed
+        if self._pending_bus_number is not None:
+            current_bus_number = self._pending_bus_number
+        elif self.i2c_bus is not None:
+            current_bus_number = self.i2c_bus_number
+        else:
+            current_bus_number = None
+
+        # Open a new I2C connection only when the bus actually changed, and
+        # before touching any state so a failed open leaves the old config
+        # fully in place
+        new_bus = None
+        if new_bus_number != current_bus_number:
+            self.logger.info(f"Using I2C bus {new_bus_number}")
             try:
-                self.i2c_bus.close()
+                new_bus = smbus2.SMBus(new_bus_number)
+                self.logger.info(f"DHT-20 initialized on I2C bus {new_bus_number}")
             except Exception as e:
-                self.logger.warning(f"Error closing I2C bus: {e}")
-            finally:
-                self.i2c_bus = None
-
-        # Get I2C bus number from configuration
-        attrs = struct_to_dict(config.attributes)
-        self.i2c_bus_number = int(attrs.get("i2c_bus", 1))
-        self.logger.info(f"Using I2C bus {self.i2c_bus_number}")
-
-        # Initialize I2C connection
-        try:
-            self.i2c_bus = smbus2.SMBus(self.i2c_bus_number)
-            self.logger.info(f"DHT-20 initialized on I2C bus {self.i2c_bus_number}")
+                self.logger.error(f"Failed to initialize DHT-20 sensor: {e}")
+                raise
+
+        # Cancel any poller left from a previous config
+        if self._poller_task is not None:
+            self._poller_task.cancel()
+            self._poller_task = None
+
+        self.poll_interval_s = poll_interval_s
+
+        if new_bus is not None:
+            # Cancel any bus switch or presence check pending for the old bus
+            if self._presence_task is not None:
+                self._presence_task.cancel()
+                self._presence_task = None
+            self._discard_pending_bus()
+
+            # Swap it in once work on the old bus has stopped, then check the
+            # sensor, without blocking the event loop for either
+            self._pending_bus = new_bus
+            self._pending_bus_number = new_bus_number
+            self._presence_task = asyncio.get_running_loop().create_task(
+                self._switch_bus(new_bus, new_bus_number)
+            )
+            self._presence_task.add_done_callback(self._on_presence_checked)
 
-            # Check if sensor is present and responsive
-            self._check_sensor_presence()
-
-        except Exception as e:
-            self.logger.error(f"Failed to initialize DHT-20 sensor: {e}")
-            raise
+        # Keep the cached reading fresh between client calls
+        self._poller_task = asyncio.get_running_loop().create_task(self._poll_loop())
 
         return super().reconfigure(config, dependencies)
 
-    def _check_sensor_presence(self):
+    async def _switch_bus(self, new_bus: smbus2.SMBus, bus_number: int):
+        """Replace the current bus with a newly opened one, then check the sensor."""
+        # Stop a measurement that may already have triggered on the old bus
+        if self._inflight is not None:
+            await _cancel_and_wait(self._inflight)
+
+        async with self._frame_lock:
+            old_bus = self.i2c_bus
+            self.i2c_bus = new_bus
+            self.i2c_bus_number = bus_number
+            self._pending_bus = None
+            self._pending_bus_number = None
+
+            # Readings taken on the old bus no longer apply
+            self._cached_readings = None
+            self._last_frame = None
+
+            if old_bus is not None:
+                try:
+                    await self._i2c_close(old_bus)
+                except Exception as e:
+                    self.logger.warning(f"Error closing I2C bus: {e}")
+
+        await self._check_sensor_presence()
+
+    def _discard_pending_bus(self):
+        """Close a bus that was opened but never installed by _switch_bus.
+
+        A never-installed bus has had no transactions, so it is safe to close
+        on the event loop thread. This can't be left to the switch coroutine,
+        which never runs at all if it is cancelled before its first step.
+        """
+        bus = self._pending_bus
+        self._pending_bus = None
+        self._pending_bus_number = None
+        if bus is not None:
+            try:
+                bus.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing I2C bus: {e}")
+
+    async def _check_sensor_presence(self):
         """Check if DHT-20 sensor is present and properly initialized."""
         if self.i2c_bus is None:
             raise RuntimeError("I2C bus not initialized")
 
         try:
-            # Read initialization status
-            time.sleep(0.5)  # Allow sensor to stabilize
-            data = self.i2c_bus.read_i2c_block_data(
-                self.DHT20_I2C_ADDRESS, self.DHT20_CMD_INIT, 1
-            )
+            # Hold the frame lock so the status read can't land between a
+            # measurement trigger and its frame read
+            async with self._frame_lock:
+                # Allow sensor to stabilize, which is only needed after power-up
+                if self.i2c_bus_number not in Dht20._powered_on_buses:
+                    await asyncio.sleep(DHT20_POWER_ON_DELAY)
+
+                # Read initialization status
+                data = await self._i2c_read_block(DHT20_CMD_INIT, 1)
+
+                # Only a sensor that answered counts as powered up
+                Dht20._powered_on_buses.add(self.i2c_bus_number)
 
             # Check if sensor is initialized (bit 3 should be 1)
-            if (data[0] | 0x08) == 0:
+            if not (data[0] & 0x08):
                 self.logger.warning(
                     "DHT-20 sensor initialization status indicates error"
                 )
@@ -136,67 +302,184 @@ class Dht20(Sensor, EasyResource):
 
         except Exception as e:
             raise RuntimeError(
-                f"DHT-20 sensor not responding at address 0x{self.DHT20_I2C_ADDRESS:02x}: {e}"
+                f"DHT-20 sensor not responding at address 0x{DHT20_I2C_ADDRESS:02x}: {e}"
             )
 
+    def _on_presence_checked(self, task: asyncio.Task):
+        """Log the outcome of the background presence check."""
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is not None:
+            self.logger.error(f"Failed to initialize DHT-20 sensor: {e}")
+
+    async def _wait_for_presence_check(self):
+        """Hold off measuring until the pending presence check has finished."""
+        presence = self._presence_task
+        if presence is not None and not presence.done():
+            # wait() doesn't raise the check's outcome; _on_presence_checked
+            # already reports it
+            await asyncio.wait([presence])
+
+    async def _poll_loop(self):
+        """Refresh the cached reading every poll interval until cancelled."""
+        while True:
+            try:
+                await self._refresh_readings()
+            except Exception as e:
+                self.logger.warning(f"Background DHT-20 reading failed: {e}")
+            await asyncio.sleep(self.poll_interval_s)
+
     async def close(self):
         """Clean up I2C resources."""
+        # Stop everything that may still touch the bus before closing it
+        for task in (self._presence_task, self._poller_task, self._inflight):
+            if task is not None:
+                await _cancel_and_wait(task)
+        self._presence_task = None
+        self._poller_task = None
+        self._inflight = None
+        self._discard_pending_bus()
+
+        # A locked-up bus can hold the worker inside an ioctl indefinitely, so
+        # both the close and the join are bounded rather than awaited forever
+        worker_stuck = False
         if self.i2c_bus is not None:
             try:
-                self.i2c_bus.close()
+                await asyncio.wait_for(
+                    self._i2c_close(self.i2c_bus), timeout=DHT20_CLOSE_TIMEOUT
+                )
                 self.logger.debug("I2C bus closed")
+            except asyncio.TimeoutError:
+                worker_stuck = True
+                self.logger.warning(
+                    f"Timed out closing I2C bus after {DHT20_CLOSE_TIMEOUT}s"
+                )
             except Exception as e:
                 self.logger.warning(f"Error closing I2C bus: {e}")
             finally:
                 self.i2c_bus = None
 
-    def _read_sensor_data(self) -> Tuple[float, float]:
-        """Read temperature and humidity from DHT-20 sensor.
+        # Join the worker off the event loop in case an ioctl is still running
+        if not worker_stuck:
+            try:
+                await asyncio.wait_for(
+                    asyncio.to_thread(self._io_pool.shutdown),
+                    timeout=DHT20_CLOSE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                worker_stuck = True
 
-        Returns:
-            Tuple[float, float]: Temperature in Celsius, Humidity as percentage
+        if worker_stuck:
+            self.logger.warning(
+                f"I2C worker still busy after {DHT20_CLOSE_TIMEOUT}s; abandoning it"
+            )
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
 
-        Raises:
-            RuntimeError: If sensor communication fails
-        """
+    async def _i2c_close(self, bus: smbus2.SMBus):
+        """Close a bus on the I2C worker thread, after any queued transaction."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, bus.close)
+
+    async def _i2c_read_block(self, cmd: int, length: int) -> List[int]:
+        """Read a block from the sensor on the I2C worker thread."""
         if self.i2c_bus is None:
             raise RuntimeError("I2C bus not initialized")
 
-        try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_pool,
+            self.i2c_bus.read_i2c_block_data,
+            DHT20_I2C_ADDRESS,
+            cmd,
+            length,
+        )
+
+    async def _i2c_rdwr(self, *msgs: i2c_msg):
+        """Submit messages as one combined I2C transaction on the worker thread."""
+        if self.i2c_bus is None:
+            raise RuntimeError("I2C bus not initialized")
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, self.i2c_bus.i2c_rdwr, *msgs)
+
+    async def _trigger_measurement(self):
+        """Send the measurement command to the sensor."""
+        await self._i2c_rdwr(i2c_msg.write(DHT20_I2C_ADDRESS, _MEASURE_COMMAND))
+
+    async def _read_frame(self) -> bytes:
+        """Read the 7-byte status + measurement frame from the sensor."""
+        msg = i2c_msg.read(DHT20_I2C_ADDRESS, 7)
+        await self._i2c_rdwr(msg)
+        return bytes(msg)
+
+    async def _fetch_raw_frame(self) -> bytes:
+        """Measure and return the raw 7-byte frame, reusing a fresh one.
+
+        Returns:
+            bytes: The frame as read from the sensor
+        """
+        # Don't trigger before the power-on delay and status read are done
+        await self._wait_for_presence_check()
+
+        async with self._frame_lock:
+            if (
+                self._last_frame is not None
+                and time.monotonic() - self._last_frame_monotonic < self.poll_interval_s
+            ):
+                return self._last_frame
+
             # Send measurement command
-            self.i2c_bus.write_i2c_block_data(
-                self.DHT20_I2C_ADDRESS,
-                self.DHT20_CMD_MEASURE,
-                self.DHT20_MEASURE_PARAMS,
-            )
+            await self._trigger_measurement()
 
             # Wait for measurement to complete
-            time.sleep(self.DHT20_MEASURE_DELAY)
+            await asyncio.sleep(DHT20_MEASURE_DELAY)
 
             # Read 7 bytes of data
-            data = self.i2c_bus.read_i2c_block_data(
-                self.DHT20_I2C_ADDRESS, self.DHT20_CMD_INIT, 7
-            )
+            frame = await self._read_frame()
+            self._last_frame = frame
+            self._last_frame_monotonic = time.monotonic()
+            return frame
+
+    @staticmethod
+    def _parse_frame(data: bytes) -> Tuple[float, float]:
+        """Convert a raw frame to temperature (Celsius) and humidity (%)."""
+        # Bytes 1-5 hold humidity (upper 20 bits) then temperature
+        # (lower 20 bits)
+        word = int.from_bytes(data[1:6], "big")
+        temperature = (word & 0xFFFFF) * _TEMP_SCALE - 50.0
+        humidity = (word >> 20) * _HUM_SCALE
+        return temperature, humidity
+
+    async def _read_sensor_data(self) -> Tuple[float, float]:
+        """Read temperature and humidity from DHT-20 sensor.
 
-            # Parse temperature data (20-bit value)
-            temp_raw = ((data[3] & 0xF) << 16) + (data[4] << 8) + data[5]
-            temperature = (200.0 * float(temp_raw) / (2**20)) - 50.0
+        Returns:
+            Tuple[float, float]: Temperature in Celsius, Humidity as percentage
 
-            # Parse humidity data (20-bit value)
-            humid_raw = ((data[3] & 0xF0) >> 4) + (data[1] << 12) + (data[2] << 4)
-            humidity = 100.0 * float(humid_raw) / (2**20)
+        Raises:
+            RuntimeError: If sensor communication fails
+        """
+        log = self.logger
 
-            # Validate readings are within reasonable ranges
-            if temperature < -40 or temperature > 80:
-                self.logger.warning(
-                    f"Temperature reading out of expected range: {temperature}°C"
-                )
-            if humidity < 0 or humidity > 100:
-                self.logger.warning(
-                    f"Humidity reading out of expected range: {humidity}%"
-                )
+        try:
+            temperature, humidity = self._parse_frame(await self._fetch_raw_frame())
 
-            self.logger.debug(f"DHT-20 reading: {temperature:.2f}°C, {humidity:.2f}%")
+            # Validate readings are within reasonable ranges
+            temp_ok = DHT20_TEMP_MIN <= temperature <= DHT20_TEMP_MAX
+            hum_ok = DHT20_HUM_MIN <= humidity <= DHT20_HUM_MAX
+            if not temp_ok or not hum_ok:
+                if not temp_ok:
+                    log.warning(
+                        "Temperature reading out of expected range: %s°C", temperature
+                    )
+                if not hum_ok:
+                    log.warning(
+                        "Humidity reading out of expected range: %s%%", humidity
+                    )
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("DHT-20 reading: %.2f°C, %.2f%%", temperature, humidity)
             return temperature, humidity
 
         except Exception as e:
@@ -216,15 +499,80 @@ class Dht20(Sensor, EasyResource):
                 - "temperature_celsius": Temperature in Celsius
                 - "humidity_percent": Relative humidity as percentage
         """
+        effective_timeout = timeout if timeout is not None else DHT20_READ_TIMEOUT
         try:
-            temperature, humidity = self._read_sensor_data()
+            return await asyncio.wait_for(
+                self._refresh_readings(), timeout=effective_timeout
+            )
 
-            return {"temperature_celsius": temperature, "humidity_percent": humidity}
+        except asyncio.TimeoutError:
+            self.logger.warning(f"DHT-20 reading timed out after {effective_timeout}s")
+            # Fall back to a recent reading rather than failing the caller;
+            # the limit scales with the poll interval so it stays longer than
+            # the window the cache already serves
+            stale_limit = max(DHT20_STALE_READING_LIMIT, 2 * self.poll_interval_s)
+            if (
+                self._cached_readings is not None
+                and time.monotonic() - self._last_reading_monotonic < stale_limit
+            ):
+                return self._cached_readings
+            raise
 
         except Exception as e:
             self.logger.error(f"Failed to get DHT-20 readings: {e}")
             raise
 
+    async def _refresh_readings(self) -> Mapping[str, SensorReading]:
+        """Return the cached reading, measuring first if it is stale."""
+        async with self._read_lock:
+            now = time.monotonic()
+            if (
+                self._cached_readings is not None
+                and now - self._last_reading_monotonic < self.poll_interval_s
+            ):
+                return self._cached_readings
+
+            inflight = self._inflight
+            if inflight is None or inflight.done():
+                inflight = asyncio.get_running_loop().create_task(self._measure())
+                self._inflight = inflight
+
+        # Shield so one caller being cancelled doesn't abort the
+        # measurement the other waiters are sharing
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # A bus switch stopped the shared measurement rather than this
+            # caller being cancelled; measure again on the new bus
+            current = asyncio.current_task()
+            if (
+                inflight.cancelled()
+                and current is not None
+                and not current.cancelling()
+            ):
+                return await self._refresh_readings()
+            raise
+
+    async def _measure(self) -> Mapping[str, SensorReading]:
+        """Take one measurement and store it as the cached reading."""
+        try:
+            try:
+                temperature, humidity = await self._read_sensor_data()
+            except RuntimeError as e:
+                # A single NACK shouldn't surface to the caller; retry once
+                self.logger.debug("Retrying DHT-20 measurement after error: %s", e)
+                await asyncio.sleep(DHT20_RETRY_DELAY)
+                temperature, humidity = await self._read_sensor_data()
+            # Age the reading by its frame, which may have come from the cache
+            self._last_reading_monotonic = self._last_frame_monotonic
+            # Read-only so the same mapping can be handed to every caller
+            self._cached_readings = types.MappingProxyType(
+                {"temperature_celsius": temperature, "humidity_percent": humidity}
+            )
+            return self._cached_readings
+        finally:
+            self._inflight = None
+
     async def do_command(
         self,
         command: Mapping[str, ValueTypes],
@@ -239,35 +587,32 @@ class Dht20(Sensor, EasyResource):
         - "get_raw_data": Returns raw sensor data bytes
         """
         cmd_name = command.get("command")
+        handler_name = (
+            Dht20._HANDLERS.get(cmd_name) if isinstance(cmd_name, str) else None
+        )
+        if handler_name is None:
+            return {"error": f"Unknown command: {cmd_name}"}
 
-        if cmd_name == "get_status":
-            try:
-                self._check_sensor_presence()
-                return {"status": "ok", "i2c_bus": self.i2c_bus_number}
-            except Exception as e:
-                return {"status": "error", "error": str(e)}
+        return await getattr(self, handler_name)()
 
-        elif cmd_name == "get_raw_data":
-            try:
-                # Send measurement command and get raw bytes
-                self.i2c_bus.write_i2c_block_data(
-                    self.DHT20_I2C_ADDRESS,
-                    self.DHT20_CMD_MEASURE,
-                    self.DHT20_MEASURE_PARAMS,
-                )
-                time.sleep(self.DHT20_MEASURE_DELAY)
-                data = self.i2c_bus.read_i2c_block_data(
-                    self.DHT20_I2C_ADDRESS, self.DHT20_CMD_INIT, 7
-                )
-                return {"raw_bytes": [hex(b) for b in data]}
-            except Exception as e:
-                return {"error": str(e)}
+    async def _cmd_get_status(self) -> Mapping[str, ValueTypes]:
+        """Report sensor connection status and I2C bus."""
+        try:
+            await self._check_sensor_presence()
+            return {"status": "ok", "i2c_bus": self.i2c_bus_number}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
 
-        else:
-            return {"error": f"Unknown command: {cmd_name}"}
+    async def _cmd_get_raw_data(self) -> Mapping[str, ValueTypes]:
+        """Report the raw sensor frame as a hex string."""
+        try:
+            raw = await self._fetch_raw_frame()
+            return {"raw_bytes": raw.hex()}
+        except Exception as e:
+            return {"error": str(e)}
 
     async def get_geometries(
         self, *, extra: dict[str, Any] | None = None, timeout: float | None = None
     ) -> list[Geometry]:
         """DHT-20 sensor has no physical geometry to report."""
-        return []
+        return _EMPTY_GEOMETRIES